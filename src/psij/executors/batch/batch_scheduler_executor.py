@@ -1,5 +1,6 @@
 import logging
 import os
+import random
 import subprocess
 import time
 import traceback
@@ -7,7 +8,7 @@ import weakref
 from abc import abstractmethod
 from datetime import timedelta
 from pathlib import Path
-from threading import Thread, RLock
+from threading import Thread, RLock, Event
 from typing import Optional, List, Dict, Collection, cast, Union, IO
 
 from psij.launchers.script_based_launcher import ScriptBasedLauncher
@@ -18,6 +19,10 @@ from psij.executors.batch.template_function_library import ALL as FUNCTION_LIBRA
 
 UNKNOWN_ERROR = 'PSIJ: Unknown error'
 
+# used for adaptive queue polling (see BatchSchedulerExecutorConfig.max_queue_polling_interval)
+_POLLING_BACKOFF_FACTOR = 1.5
+_POLLING_JITTER = 0.1
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,7 +88,7 @@ class BatchSchedulerExecutorConfig(JobExecutorConfig):
                  work_directory: Optional[Path] = None, queue_polling_interval: int = 30,
                  initial_queue_polling_delay: int = 2,
                  queue_polling_error_threshold: int = 2,
-                 keep_files: bool = False):
+                 keep_files: bool = False, max_queue_polling_interval: Optional[int] = None):
         """
         Parameters
         ----------
@@ -104,12 +109,27 @@ class BatchSchedulerExecutorConfig(JobExecutorConfig):
         keep_files
             Whether to keep submit files and auxiliary job files (exit code and output files) after
             a job has completed.
+        max_queue_polling_interval
+            If set, enables adaptive queue polling. Each poll that does not result in a job state
+            change increases the polling interval by a factor of 1.5, up to this value, in seconds.
+            The interval is reset to `queue_polling_interval` whenever a job changes state. When a
+            new job is registered with the executor, a pending backed off wait is cut short, so
+            that the first poll for the new job happens at most `queue_polling_interval` seconds
+            after its registration. A small random jitter is added to each adaptive interval so
+            that multiple executors do not end up polling the queue in lockstep. This value must
+            not be smaller than `queue_polling_interval`.
         """
         super().__init__(launcher_log_file, work_directory)
         self.queue_polling_interval = queue_polling_interval
         self.initial_queue_polling_delay = initial_queue_polling_delay
         self.queue_polling_error_threshold = queue_polling_error_threshold
         self.keep_files = keep_files
+        if max_queue_polling_interval is not None \
+                and max_queue_polling_interval < queue_polling_interval:
+            raise ValueError('max_queue_polling_interval (%s) must not be smaller than '
+                             'queue_polling_interval (%s)' % (max_queue_polling_interval,
+                                                              queue_polling_interval))
+        self.max_queue_polling_interval = max_queue_polling_interval
         if 'PSIJ_BATCH_KEEP_FILES' in os.environ:
             self.keep_files = True
 
@@ -246,7 +266,7 @@ class BatchSchedulerExecutor(JobExecutor):
             if logger.isEnabledFor(logging.DEBUG):
                 with submit_file_path.open('r') as submit_file:
                     script = submit_file.read()
-                logger.debug('Job %s: submit script is: %s' % (job.id, script))
+                logger.debug('Job %s: submit script is: %s', job.id, script)
 
             raise SubmitException(ex.output) from None
 
@@ -474,8 +494,9 @@ class BatchSchedulerExecutor(JobExecutor):
         """Parses the output of the command obtained from :func:`~get_list_command`.
 
         The default implementation of this method assumes that the output has no header and
-        consists of native IDs, one per line, possibly surrounded by whitespace. Concrete
-        implementations should override this method if a different format is expected.
+        consists of native IDs, one per line, possibly surrounded by whitespace. Blank lines are
+        ignored. Concrete implementations should override this method if a different format is
+        expected.
 
         Parameters
         ----------
@@ -486,7 +507,7 @@ class BatchSchedulerExecutor(JobExecutor):
         A list of strings representing the native IDs of the jobs known to the LRM for the current
         user.
         """
-        return [s.strip() for s in out.splitlines()]
+        return [native_id for line in out.splitlines() if (native_id := line.strip())]
 
     def _create_script_context(self, job: Job) -> Dict[str, object]:
         launcher = self._get_launcher_from_job(job)
@@ -660,27 +681,55 @@ class _QueuePollThread(Thread):
         self._jobs: Dict[str, List[Job]] = {}
         # counts consecutive errors while invoking qstat or equivalent
         self._poll_error_count = 0
+        # set when jobs are registered; makes the poll that follows reset the polling interval
+        self._jobs_added = False
+        # signaled when jobs are registered in order to interrupt a backed off wait
+        self._wakeup = Event()
         self._jobs_lock = RLock()
 
     def run(self) -> None:
         logger.debug('Executor %s: queue poll thread started', self.executor())
         time.sleep(self.config.initial_queue_polling_delay)
+        interval = float(self.config.queue_polling_interval)
         while not self.done:
-            self._poll()
+            changed = self._poll()
+            interval = self._next_polling_interval(interval, changed)
+            self._wait(interval)
+
+    def _wait(self, interval: float) -> None:
+        if self._wakeup.wait(interval + self._polling_jitter(interval)):
+            self._wakeup.clear()
+            # A job was registered while waiting; poll for it after the base interval rather than
+            # after whatever is left of the (possibly much longer) backed off interval
             time.sleep(self.config.queue_polling_interval)
 
+    def _next_polling_interval(self, interval: float, changed: bool) -> float:
+        max_interval = self.config.max_queue_polling_interval
+        if changed or max_interval is None:
+            return float(self.config.queue_polling_interval)
+        return min(interval * _POLLING_BACKOFF_FACTOR, float(max_interval))
+
+    def _polling_jitter(self, interval: float) -> float:
+        if self.config.max_queue_polling_interval is None:
+            return 0
+        return random.uniform(0, interval * _POLLING_JITTER)
+
     def _stop(self, exec: object) -> None:
         self.done = True
 
-    def _poll(self) -> None:
+    def _poll(self) -> bool:
+        # returns False only if the poll went through and no job changed state
         exec = self.executor()
         if exec is None:
-            return
+            return True
         with self._jobs_lock:
+            self._remove_final_jobs()
             if len(self._jobs) == 0:
-                return
+                return True
             jobs_copy = dict(self._jobs)
-        logger.info('Polling for %s jobs', len(jobs_copy))
+            changed = self._jobs_added
+            self._jobs_added = False
+        logger.debug('Polling for %s jobs', len(jobs_copy))
         try:
             out = exec._run_command(exec.get_status_command(jobs_copy.keys()))
         except subprocess.CalledProcessError as ex:
@@ -689,7 +738,7 @@ class _QueuePollThread(Thread):
         except Exception as ex:
             self._handle_poll_error(exec, True, ex,
                                     f'Failed to poll for job status: {traceback.format_exc()}')
-            return
+            return True
         else:
             exit_code = 0
             self._poll_error_count = 0
@@ -699,7 +748,7 @@ class _QueuePollThread(Thread):
         except Exception as ex:
             self._handle_poll_error(exec, False, ex,
                                     f'Failed to poll for job status: {traceback.format_exc()}')
-            return
+            return True
         try:
             for native_id, job_list in jobs_copy.items():
                 try:
@@ -709,13 +758,25 @@ class _QueuePollThread(Thread):
                                        message='Failed to update job status: %s' %
                                                traceback.format_exc())
                 for job in job_list:
+                    old_state = job.status.state
                     exec._set_job_status(job, status)
+                    if job.status.state != old_state:
+                        changed = True
                 if status.state.final:
                     with self._jobs_lock:
                         del self._jobs[native_id]
         except Exception as ex:
             msg = traceback.format_exc()
             self._handle_poll_error(exec, True, ex, 'Error updating job statuses {}'.format(msg))
+            return True
+        return changed
+
+    def _remove_final_jobs(self) -> None:
+        # Jobs can reach a final state without going through _poll (e.g., attached jobs
+        # that were already done); there is no point in asking the queue about them
+        for native_id in [native_id for native_id, job_list in self._jobs.items()
+                          if all(job.status.state.final for job in job_list)]:
+            del self._jobs[native_id]
 
     def _get_job_status(self, native_id: str, status_map: Dict[str, JobStatus]) -> JobStatus:
         if native_id in status_map:
@@ -745,6 +806,9 @@ class _QueuePollThread(Thread):
 
     def register_job(self, job: Job) -> None:
         assert job.native_id
+        if job.status.state.final:
+            logger.debug('Job %s: already in a final state; not registering', job.id)
+            return
         logger.info('Job %s: registering', job.id)
         with self._jobs_lock:
             native_id = job.native_id
@@ -752,3 +816,6 @@ class _QueuePollThread(Thread):
                 self._jobs[native_id] = [job]
             else:
                 self._jobs[job.native_id].append(job)
+            self._jobs_added = True
+        if self.config.max_queue_polling_interval is not None:
+            self._wakeup.set()
@@ -227,9 +227,5 @@ class NQSVJobExecutor(BatchSchedulerExecutor):
 
     def parse_list_output(self, out: str) -> List[str]:
         """Parse the output of the list command."""
-        r = []
-        lines = iter(out.split('\n'))
-        for line in lines:
-            c = line.split('.')
-            r.append(c[0])
-        return r
+        return [line.split('.', maxsplit=1)[0] for line in out.splitlines()
+                if line.strip()]
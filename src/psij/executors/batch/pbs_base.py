@@ -152,7 +152,7 @@ class GenericPBSJobExecutor(BatchSchedulerExecutor):
 
     def parse_list_output(self, out: str) -> List[str]:
         """See :meth:`~.BatchSchedulerExecutor.parse_list_output`."""
-        return [s.split()[0].strip() for s in out.splitlines()[2:]]
+        return [cols[0] for line in out.splitlines()[2:] if (cols := line.split())]
 
     def _get_state(self, state: str) -> JobState:
         assert state in _STATE_MAP, f"PBS state {state} is not known to PSI/J"
@@ -1,3 +1,4 @@
+import functools
 import pathlib
 from abc import ABC
 from typing import Dict, Callable, IO
@@ -8,6 +9,14 @@ from psij import Job, JobExecutorConfig
 from .escape_functions import bash_escape
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_template(template_path: pathlib.Path) -> pystache.parsed.ParsedTemplate:
+    # Templates are static files shipped with executors, so parse each one only once per
+    # process rather than once per executor instance.
+    with template_path.open('r') as template_file:
+        return pystache.parse(template_file.read())
+
+
 class SubmitScriptGenerator(ABC):
     """A base class representing a submit script generator.
 
@@ -70,8 +79,7 @@ class TemplatedScriptGenerator(SubmitScriptGenerator):
             strings for use in bash scripts is used.
         """
         super().__init__(config)
-        with template_path.open('r') as template_file:
-            self.template = pystache.parse(template_file.read())
+        self.template = _parse_template(template_path)
         self.renderer = pystache.Renderer(escape=escape)
 
     def generate_submit_script(self, job: Job, context: Dict[str, object], out: IO[str]) -> None:
@@ -161,7 +161,7 @@ class _ProcessReaper(SingletonThread):
             self._jobs[entry.job] = entry
 
     def run(self) -> None:
-        logger.debug('Started {}'.format(self))
+        logger.debug('Started %s', self)
         done: List[_ProcessEntry] = []
         while True:
             with self._lock:
@@ -171,7 +171,7 @@ class _ProcessReaper(SingletonThread):
             try:
                 done = self._check_processes(jobs)
             except Exception as ex:
-                logger.error('Error polling for process status', ex)
+                logger.error('Error polling for process status: %s', ex)
             with self._cvar:
                 self._cvar.wait(_REAPER_SLEEP_TIME)
 
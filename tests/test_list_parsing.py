@@ -0,0 +1,46 @@
+from typing import List
+
+import pytest
+
+from psij import JobExecutor
+from psij.executors.batch.batch_scheduler_executor import BatchSchedulerExecutor
+
+
+def _parse(executor_name: str, out: str) -> List[str]:
+    ex = JobExecutor.get_instance(executor_name)
+    assert isinstance(ex, BatchSchedulerExecutor)
+    return ex.parse_list_output(out)
+
+
+@pytest.mark.parametrize('out,expected', [
+    ('1\n2\n', ['1', '2']),
+    (' 1 \n\n2\n\n', ['1', '2']),
+    ('1\n   \n2', ['1', '2']),
+    ('', [])
+])
+def test_default_list_parsing(out: str, expected: List[str]) -> None:
+    # the batch-test executor does not override parse_list_output
+    assert _parse('batch-test', out) == expected
+
+
+_PBS_HEADER = ('Job id            Name             User              Time Use S Queue\n'
+               '----------------  ---------------- ----------------  -------- - -----\n')
+
+
+@pytest.mark.parametrize('out,expected', [
+    (_PBS_HEADER + '1.host  job1  user  00:00:00 R workq\n'
+                   '2.host  job2  user  00:00:00 Q workq\n', ['1.host', '2.host']),
+    (_PBS_HEADER + '1.host  job1  user  00:00:00 R workq\n\n   \n', ['1.host']),
+    (_PBS_HEADER, [])
+])
+def test_pbs_list_parsing(out: str, expected: List[str]) -> None:
+    assert _parse('pbs', out) == expected
+
+
+@pytest.mark.parametrize('out,expected', [
+    ('1.host\n2.host\n', ['1', '2']),
+    ('1.host\n\n  \n2.host', ['1', '2']),
+    ('', [])
+])
+def test_nqsv_list_parsing(out: str, expected: List[str]) -> None:
+    assert _parse('nqsv', out) == expected
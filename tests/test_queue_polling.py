@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Optional, Collection, List
+
+import pytest
+
+from psij import Job, JobExecutor, JobState, JobStatus
+from psij.executors.batch.batch_scheduler_executor import BatchSchedulerExecutor, \
+    BatchSchedulerExecutorConfig, _QueuePollThread
+
+
+def _poll_thread(queue_polling_interval: int = 2,
+                 max_queue_polling_interval: Optional[int] = None) -> _QueuePollThread:
+    # the thread is not started, so it is only used for its polling logic
+    ex = JobExecutor.get_instance('batch-test')
+    assert isinstance(ex, BatchSchedulerExecutor)
+    config = BatchSchedulerExecutorConfig(queue_polling_interval=queue_polling_interval,
+                                          max_queue_polling_interval=max_queue_polling_interval)
+    return _QueuePollThread('test queue poll thread', config, ex)
+
+
+def test_polling_interval_backoff() -> None:
+    t = _poll_thread(2, 10)
+    intervals = []
+    interval = 2.0
+    for _ in range(6):
+        interval = t._next_polling_interval(interval, False)
+        intervals.append(interval)
+    assert intervals == [3.0, 4.5, 6.75, 10.0, 10.0, 10.0]
+
+
+def test_polling_interval_reset() -> None:
+    t = _poll_thread(2, 10)
+    assert t._next_polling_interval(10.0, True) == 2.0
+    assert t._next_polling_interval(4.5, True) == 2.0
+
+
+def test_polling_jitter() -> None:
+    t = _poll_thread(2, 10)
+    for _ in range(100):
+        jitter = t._polling_jitter(10.0)
+        assert 0 <= jitter <= 1.0
+
+
+def test_fixed_polling_interval() -> None:
+    t = _poll_thread(2)
+    assert t._next_polling_interval(2.0, False) == 2.0
+    assert t._next_polling_interval(2.0, True) == 2.0
+    assert t._polling_jitter(2.0) == 0
+
+
+def test_max_polling_interval_smaller_than_base() -> None:
+    with pytest.raises(ValueError):
+        BatchSchedulerExecutorConfig(queue_polling_interval=30, max_queue_polling_interval=10)
+    # equal values are allowed and amount to a fixed interval with jitter
+    t = _poll_thread(10, 10)
+    assert t._next_polling_interval(10.0, False) == 10.0
+
+
+def test_registration_interrupts_backed_off_wait() -> None:
+    t = _poll_thread(1, 600)
+    job = Job()
+    job._native_id = '1'
+    timer = threading.Timer(0.2, t.register_job, args=(job,))
+    start = time.monotonic()
+    timer.start()
+    t._wait(600.0)
+    timer.join()
+    assert time.monotonic() - start < 5
+    assert t._jobs_added
+
+
+def _final_job(native_id: str) -> Job:
+    job = Job()
+    job._native_id = native_id
+    job.status = JobStatus(JobState.COMPLETED)
+    return job
+
+
+def test_final_jobs_are_not_registered() -> None:
+    t = _poll_thread()
+    t.register_job(_final_job('1'))
+    assert '1' not in t._jobs
+
+    ex = JobExecutor.get_instance('batch-test')
+    assert isinstance(ex, BatchSchedulerExecutor)
+    ex.attach(_final_job('2'), '2')
+    assert '2' not in ex._queue_poll_thread._jobs
+
+
+def test_final_jobs_are_not_polled() -> None:
+    ex = JobExecutor.get_instance('batch-test')
+    assert isinstance(ex, BatchSchedulerExecutor)
+    config = BatchSchedulerExecutorConfig()
+    t = _QueuePollThread('test queue poll thread', config, ex)
+    job = Job()
+    job._native_id = '1'
+    t.register_job(job)
+    assert '1' in t._jobs
+    # the job reaches a final state without the poll thread being involved
+    job.status = JobStatus(JobState.COMPLETED)
+
+    # _poll() handles exceptions from the status command, so record calls instead of raising
+    calls = []
+
+    def _get_status_command(native_ids: Collection[str]) -> List[str]:
+        calls.append(list(native_ids))
+        return ['true']
+
+    ex.get_status_command = _get_status_command  # type: ignore
+    t._poll()
+    assert calls == []
+    assert '1' not in t._jobs